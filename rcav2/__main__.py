@@ -36,4 +36,12 @@ async def run_cli() -> None:
 
 
 def main():
-    asyncio.run(run_cli())
+    # uvicorn already picks uvloop for the API server; do the same for the
+    # CLI entrypoint when it is available.
+    try:
+        import uvloop
+
+        runner = uvloop.run
+    except ImportError:
+        runner = asyncio.run
+    runner(run_cli())
@@ -1,6 +1,7 @@
 # Copyright © 2025 Red Hat
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import dspy  # type: ignore[import-untyped]
 from pydantic import BaseModel
 import glob
@@ -25,6 +26,12 @@ class DSPyAnsibleOracle(dspy.Signature):
 
 
 root = rcav2.tools.git.workspace_root.expanduser()
+_root_prefix_len = len(str(root)) + 1
+
+# Glob results are cached per pattern: agents repeat the same searches within
+# and across jobs. The key includes the workspace generation so a repo
+# cloned or updated mid-process invalidates the stale entries.
+_glob_cache: dict[tuple[str, int], list[str]] = {}
 
 
 def make_agent(worker: Worker) -> dspy.ReAct:
@@ -32,7 +39,8 @@ def make_agent(worker: Worker) -> dspy.ReAct:
         """Read a file content, return None when there is an error"""
         await worker.emit(f"Reading {path}", "progress")
         try:
-            return (root / path).read_text()
+            # Read in a thread to keep the event loop free for other jobs.
+            return await asyncio.to_thread((root / path).read_text)
         except Exception as e:
             await worker.emit(f"{path}: read error {e}", "warning")
             print(f"{path}: read error {e}")
@@ -41,14 +49,23 @@ def make_agent(worker: Worker) -> dspy.ReAct:
     async def find_file(path_glob: str) -> list[str]:
         """Return paths matching a glob pattern."""
         await worker.emit(f"Searching {path_glob}", "progress")
-        return glob.glob(path_glob, root_dir=root)
+        key = (path_glob, rcav2.tools.git.workspace_generation)
+        if (paths := _glob_cache.get(key)) is None:
+            paths = _glob_cache[key] = await asyncio.to_thread(
+                glob.glob, path_glob, root_dir=root
+            )
+        return paths
 
     return dspy.ReAct(DSPyAnsibleOracle, tools=[read_file, find_file])
 
 
+def relative_playbooks(plays: list) -> list[str]:
+    """Make the paths relative to the workspace."""
+    return [str(p)[_root_prefix_len:] for p in plays]
+
+
 async def call_agent(agent: dspy.ReAct, plays: list[str], worker: Worker) -> Job:
-    # Make the path relative to the workspace
-    playbooks = list(map(lambda p: str(p)[len(str(root)) + 1 :], plays))
+    playbooks = relative_playbooks(plays)
 
     await worker.emit("Calling AnsibleOracle", "progress")
     await worker.emit(playbooks, "playbooks")
@@ -2,9 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import dspy  # type: ignore[import-untyped]
+import hashlib
+import json
+from functools import lru_cache
 
+import rcav2.database
 import rcav2.models.errors
 import rcav2.agent.ansible
+from rcav2.env import Env
 from rcav2.models.report import PossibleRootCause
 from rcav2.worker import Worker
 
@@ -62,7 +67,10 @@ class RCAAccelerator(dspy.Signature):
     possible_root_causes: list[PossibleRootCause] = dspy.OutputField()
 
 
+@lru_cache(maxsize=1)
 def make_agent() -> dspy.Predict:
+    # The program is stateless (inputs flow through acall), so build the
+    # ChainOfThought predictor once and share it across requests.
     return dspy.ChainOfThought(RCAAccelerator, max_tokens=1024 * 1024)
 
 
@@ -71,6 +79,7 @@ async def call_agent(
     job: rcav2.agent.ansible.Job | None,
     errors: rcav2.models.errors.Report,
     worker: Worker,
+    env: Env | None = None,
 ) -> tuple[list[PossibleRootCause], str]:
     if not job:
         job = rcav2.agent.ansible.Job(description="", actions=[])
@@ -79,10 +88,42 @@ async def call_agent(
     if log_url := errors.log_url:
         job.description += f"\n\nBuild Log URL: {log_url}"
 
-    await worker.emit("Calling RCAPredict", "progress")
     errors_report = report_to_prompt(errors)
+
+    # Distinct builds often hit identical error reports; when the model is
+    # deterministic the whole LLM call can be served from the cache.
+    prompt_hash = None
+    if env and env.settings.LLM_TEMPERATURE == 0:
+        prompt_hash = hashlib.sha256(
+            "\0".join([job.model_dump_json(), errors_report]).encode()
+        ).hexdigest()
+        if cached := await rcav2.database.allm_get(env.db, prompt_hash):
+            await worker.emit("Calling RCAPredict (cached)", "progress")
+            result = json.loads(cached)
+            return (
+                [
+                    PossibleRootCause.model_validate(cause)
+                    for cause in result["possible_root_causes"]
+                ],
+                result["summary"],
+            )
+
+    await worker.emit("Calling RCAPredict", "progress")
     result = await agent.acall(job=job, errors=errors_report)
     await rcav2.model.emit_dspy_usage(result, worker)
+    if env and prompt_hash:
+        await rcav2.database.allm_set(
+            env.db,
+            prompt_hash,
+            json.dumps(
+                dict(
+                    summary=result.summary,
+                    possible_root_causes=[
+                        cause.model_dump() for cause in result.possible_root_causes
+                    ],
+                )
+            ),
+        )
     return (result.possible_root_causes, result.summary)
 
 
@@ -92,15 +133,15 @@ def report_to_prompt(report: rcav2.models.errors.Report) -> str:
     >>> report_to_prompt(rcav2.models.errors.json_to_report(TEST_REPORT))
     '\\n## zuul/overcloud.log\\noops'
     """
-    lines = []
+    lines: list[str] = []
     for logfile in report.logfiles:
         lines.append(f"\n## {logfile.source}")
         for error in logfile.errors:
-            for line in error.before:
-                lines.append(line)
+            # extend/append in bulk: this walks every context line of the
+            # report, so skip the per-line method dispatch.
+            lines.extend(error.before)
             lines.append(error.line)
-            for line in error.after:
-                lines.append(line)
+            lines.extend(error.after)
     return "\n".join(lines)
 
 
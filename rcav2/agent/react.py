@@ -334,7 +334,7 @@ def make_agent(errors: rcav2.models.errors.Report, worker: Worker, env) -> dspy.
             f"Searching slack with query: {query}, count: {count}",
             "progress",
         )
-        return env.slack.search_messages(query, count)
+        return await env.slack.search_messages(query, count)
 
     async def check_build_log_directory(directory_path: str) -> dict[str, str | bool]:
         """Check if a directory exists in the build logs.
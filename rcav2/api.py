@@ -6,27 +6,34 @@ This module defines the FastAPI handlers.
 """
 
 from fastapi import FastAPI, Request, APIRouter
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from contextlib import asynccontextmanager
 import asyncio
-import json
+import orjson
 
+import rcav2.database
 import rcav2.tools.logjuicer
 from rcav2.env import Env
 import rcav2.model
 import rcav2.auth
 import rcav2.tools.zuul
 import rcav2.workflows
-from rcav2.worker import APIWorker, Watcher
+from rcav2.worker import APIWorker, Watcher, encode_frame
 
 
-async def run(worker: APIWorker, env: Env, workflow: str, url: str) -> None:
+async def run(worker: APIWorker, state: "RcaState", workflow: str, url: str) -> None:
     try:
-        await rcav2.workflows.run_workflow(env, workflow, url, worker)
+        async with state.jobs:
+            await rcav2.workflows.run_workflow(state.env, workflow, url, worker)
+        await rcav2.database.aset(
+            state.db, workflow, url, orjson.dumps(worker.events())
+        )
         await worker.emit("completed", event="status")
     except Exception as e:
-        env.log.exception("Job failed")
+        state.env.log.exception("Job failed")
         await worker.emit(f"Analysis failed: {e}", event="status")
+    finally:
+        state.inflight.pop((workflow, url), None)
 
 
 router = APIRouter()
@@ -34,8 +41,22 @@ router = APIRouter()
 
 class RcaState:
     def __init__(self, debug):
-        self.env = Env(debug=debug, cookie_path=None)
-        rcav2.model.init_dspy()
+        self.env = Env(debug=debug)
+        self.db = self.env.db
+        self.jobs = asyncio.Semaphore(self.env.settings.RCA_WORKER_CONCURRENCY)
+        # In-flight jobs, so concurrent /get of the same build share one run.
+        self.inflight: dict[tuple[str, str], APIWorker] = {}
+        rcav2.model.init_dspy(self.env.settings)
+
+
+async def cookie_refresher(env: Env) -> None:
+    """Keep the OIDC cookie warm so jobs never pay the refresh cost."""
+    while True:
+        try:
+            await rcav2.auth.ensure_cookie(env)
+        except Exception:
+            env.log.exception("Cookie refresh failed")
+        await asyncio.sleep(3600)
 
 
 @asynccontextmanager
@@ -43,17 +64,39 @@ async def lifespan(app: FastAPI):
     """Setup the fastapi app.state"""
     # setup
     app.state.rca = RcaState(True)
+    refresher = asyncio.create_task(cookie_refresher(app.state.rca.env))
     yield
     # teardown
-    pass
+    refresher.cancel()
+
+
+def replay_frames(blob: bytes) -> bytes:
+    """Re-encode persisted events as SSE frames.
+
+    The blob is written before the completion status is emitted, so a
+    final status frame is appended here; without it EventSource never
+    closes and reconnects forever.
+    """
+    frames = [encode_frame((kind, body))[1] for kind, body in orjson.loads(blob)]
+    frames.append(encode_frame(("status", "completed"))[1])
+    return b"".join(frames)
 
 
-async def do_watch(watcher):
+async def do_watch(watcher, prelude: bytes = b""):
     """The watch handler, to follow the progress of a job."""
+    if prelude:
+        yield prelude
     while True:
-        event = await watcher.recv()
-        yield f"data: {json.dumps(event)}\n\n"
-        if event[0] == "status":
+        (kind, frame) = await watcher.recv()
+        # Coalesce whatever is already queued into a single chunk: a long
+        # run emits hundreds of tiny progress frames, and one send syscall
+        # per frame adds up. The first event still flushes right away.
+        chunk = [frame]
+        while kind != "status" and (more := watcher.recv_nowait()):
+            (kind, frame) = more
+            chunk.append(frame)
+        yield b"".join(chunk)
+        if kind == "status":
             break
 
 
@@ -61,8 +104,28 @@ async def do_watch(watcher):
 async def get(request: Request, build: str, workflow: str = "react"):
     """Perform RCA on a given build."""
     state = request.app.state.rca
-    await rcav2.auth.ensure_cookie(state.env)
+    # The frontend reads this endpoint with EventSource, which rejects
+    # anything that is not text/event-stream, so cached runs are replayed
+    # as SSE frames in one response body.
+    if events := await rcav2.database.aget(state.db, workflow, build):
+        return Response(
+            content=replay_frames(events),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
     watcher = Watcher()
-    worker = APIWorker(watcher)
-    asyncio.create_task(run(worker, state.env, workflow, build))
-    return StreamingResponse(do_watch(watcher), media_type="text/event-stream")
+    prelude = b""
+    # Coalesce concurrent submissions: a second caller follows the run that
+    # is already in flight instead of starting a duplicate LLM analysis.
+    if worker := state.inflight.get((workflow, build)):
+        prelude = worker.attach(watcher)
+    else:
+        worker = APIWorker(watcher)
+        state.inflight[(workflow, build)] = worker
+        asyncio.create_task(run(worker, state, workflow, build))
+    return StreamingResponse(
+        do_watch(watcher, prelude),
+        media_type="text/event-stream",
+        # Make sure a reverse proxy doesn't hold back the progress frames.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -5,24 +5,27 @@
 This module handles the authentication logic.
 """
 
+import asyncio
 import os
-import subprocess
 import httpx
 import time
 from .env import Env
 
 
-# TODO: make this async?
-def ensure_kerberos():
+async def ensure_kerberos():
     """Ensure kerberos ticket is configured."""
-    try:
-        subprocess.check_call(["klist", "-s"])
-    except subprocess.CalledProcessError:
+    proc = await asyncio.create_subprocess_exec("klist", "-s")
+    if await proc.wait():
         if pwd := os.environ.get("KRB_PASS"):
-            cmd = ["kinit", os.environ["KRB_USER"]]
-            subprocess.run(
-                cmd, input=pwd.encode("utf-8"), stdout=subprocess.PIPE
-            ).check_returncode()
+            proc = await asyncio.create_subprocess_exec(
+                "kinit",
+                os.environ["KRB_USER"],
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+            )
+            await proc.communicate(pwd.encode("utf-8"))
+            if proc.returncode:
+                raise RuntimeError("kinit failed")
         else:
             raise RuntimeError("No kerberos auth available, please run kinit")
 
@@ -38,9 +41,13 @@ async def get_oidc_cookie(env: Env):
 
 async def ensure_cookie(env: Env):
     """Ensure the OIDC cookie is fresh in the env."""
-    now = time.time()
-    if not env.cookie or now - env.cookie_age > (23.8 * 3600):
-        ensure_kerberos()
-        env.cookie = await get_oidc_cookie(env)
-        if env.cookie:
-            env.cookie_age = now
+    # The lock coalesces concurrent refreshes: late arrivals re-check the
+    # age and find the cookie their predecessor just fetched.
+    async with env.cookie_lock:
+        now = time.time()
+        if not env.cookie or now - env.cookie_age > (23.8 * 3600):
+            await ensure_kerberos()
+            env.cookie = await get_oidc_cookie(env)
+            if env.cookie:
+                env.cookie_age = now
+                env.save_cookie()
@@ -5,6 +5,7 @@
 This module defines the system configuration using pydantic_settings
 """
 
+from functools import lru_cache
 from typing import Annotated
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, NoDecode
@@ -37,28 +38,31 @@ class Settings(BaseSettings):
     SLACK_SEARCH_CHANNELS: Annotated[list[str], NoDecode] = []
 
     # Internal config
+    # How many RCA jobs may run concurrently; the workload is I/O bound so
+    # this mostly bounds the LM fan-out.
+    RCA_WORKER_CONCURRENCY: int = 16
     CA_BUNDLE_PATH: str = "/etc/pki/ca-trust/extracted/pem/tls-ca-bundle.pem"
     COOKIE_FILE: str = ".cookie"
     JOB_DESCRIPTION_FILE: str | None = None
 
-    @field_validator("OPIK_TAGS", mode="before")
+    @field_validator(
+        "OPIK_TAGS", "JIRA_RCA_PROJECTS", "SLACK_SEARCH_CHANNELS", mode="before"
+    )
     @classmethod
-    def parse_tags(cls, v):
+    def parse_lists(cls, v):
         return parse_list(v)
 
-    @field_validator("JIRA_RCA_PROJECTS", mode="before")
-    @classmethod
-    def parse_projects(cls, v):
-        return parse_list(v)
 
-    @field_validator("SLACK_SEARCH_CHANNELS", mode="before")
-    @classmethod
-    def parse_channels(cls, v):
-        return parse_list(v)
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse the environment once per process."""
+    # pydantic is magic and it auto load the missing named arguments from the
+    # environment.
+    return Settings()  # type: ignore
 
 
 def parse_list(v):
     """Parse comma separated list"""
     if isinstance(v, str):
-        return [s.strip() for s in v.split(",") if s.strip()]
+        return [s for s in (x.strip() for x in v.split(",")) if s]
     return v
@@ -0,0 +1,181 @@
+# Copyright © 2025 Red Hat
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+This module persists completed RCA reports in a local SQLite database.
+"""
+
+import asyncio
+import sqlite3
+import time
+
+
+class TTLCache[K, V]:
+    """A small in-memory cache with TTL expiry and an LRU-style bound."""
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        if entry := self._data.pop(key, None):
+            (ts, value) = entry
+            if time.monotonic() - ts < self.ttl:
+                # Re-insert so hot entries are the last to be evicted.
+                self._data[key] = entry
+                return value
+        return None
+
+    def set(self, key: K, value: V) -> None:
+        now = time.monotonic()
+        self._data[key] = (now, value)
+        # Evict expired entries, then the least recently used overflow, so
+        # a long-running process does not retain every value ever cached.
+        for k in [k for k, (ts, _) in self._data.items() if now - ts >= self.ttl]:
+            del self._data[k]
+        while len(self._data) > self.maxsize:
+            del self._data[next(iter(self._data))]
+
+
+# In-memory layer over job_cache: busy CI projects re-request the same job
+# for every build, so skip the SQLite read after the first cold lookup.
+_job_cache = TTLCache[str, str](ttl=300.0, maxsize=512)
+
+# Same idea for completed reports: page reloads and shared links hit the
+# same (workflow, build) in bursts, so keep the hot ones in memory briefly.
+_report_cache = TTLCache[tuple[str, str], bytes](ttl=60.0, maxsize=128)
+
+
+def create(path: str = ".db.sqlite3") -> sqlite3.Connection:
+    """Setup the database connection."""
+    # check_same_thread is off so the async wrappers below can run the
+    # queries in worker threads; sqlite3 itself is thread-safe.
+    db = sqlite3.connect(path, check_same_thread=False)
+    # WAL lets concurrent readers proceed while a report is being written,
+    # and NORMAL sync is plenty for a rebuildable cache.
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    # Wait out short write bursts instead of failing with "database is
+    # locked", and keep temp structures out of the filesystem.
+    db.execute("PRAGMA busy_timeout=30000")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS reports ("
+        "workflow TEXT, build TEXT, events BLOB, "
+        "PRIMARY KEY (workflow, build))"
+    )
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS job_cache ("
+        "playbook_hash TEXT PRIMARY KEY, job_json TEXT, created_at REAL)"
+    )
+    try:
+        # Upgrade databases created before job entries had an age.
+        db.execute("ALTER TABLE job_cache ADD COLUMN created_at REAL")
+    except sqlite3.OperationalError:
+        pass
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache ("
+        "prompt_hash TEXT PRIMARY KEY, result TEXT)"
+    )
+    return db
+
+
+def get(db: sqlite3.Connection, workflow: str, build: str) -> bytes | None:
+    """Return the serialized events of a completed report."""
+    if (events := _report_cache.get((workflow, build))) is not None:
+        return events
+    row = db.execute(
+        "SELECT events FROM reports WHERE workflow = ? AND build = ?",
+        (workflow, build),
+    ).fetchone()
+    if row:
+        _report_cache.set((workflow, build), row[0])
+        return row[0]
+    return None
+
+
+def set(db: sqlite3.Connection, workflow: str, build: str, events: bytes) -> None:
+    """Store the serialized events of a completed report."""
+    with db:
+        db.execute(
+            "INSERT OR REPLACE INTO reports VALUES (?, ?, ?)",
+            (workflow, build, events),
+        )
+    _report_cache.set((workflow, build), events)
+
+
+def get_job(db: sqlite3.Connection, playbook_hash: str) -> str | None:
+    """Return the cached job description for a playbook set."""
+    if (job_json := _job_cache.get(playbook_hash)) is not None:
+        return job_json
+    # Let SQLite apply the freshness rule so stale rows never round-trip.
+    cutoff = time.time() - 24 * 3600
+    row = db.execute(
+        "SELECT job_json FROM job_cache WHERE playbook_hash = ? AND created_at > ?",
+        (playbook_hash, cutoff),
+    ).fetchone()
+    if row:
+        _job_cache.set(playbook_hash, row[0])
+        return row[0]
+    return None
+
+
+def set_job(db: sqlite3.Connection, playbook_hash: str, job_json: str) -> None:
+    """Store the job description for a playbook set."""
+    with db:
+        db.execute(
+            "INSERT OR REPLACE INTO job_cache VALUES (?, ?, ?)",
+            (playbook_hash, job_json, time.time()),
+        )
+    _job_cache.set(playbook_hash, job_json)
+
+
+async def aget(db: sqlite3.Connection, workflow: str, build: str) -> bytes | None:
+    """Async wrapper for get, keeping the event loop free during disk I/O."""
+    return await asyncio.to_thread(get, db, workflow, build)
+
+
+async def aset(
+    db: sqlite3.Connection, workflow: str, build: str, events: bytes
+) -> None:
+    """Async wrapper for set, keeping the event loop free during disk I/O."""
+    await asyncio.to_thread(set, db, workflow, build, events)
+
+
+async def aget_job(db: sqlite3.Connection, playbook_hash: str) -> str | None:
+    """Async wrapper for get_job."""
+    return await asyncio.to_thread(get_job, db, playbook_hash)
+
+
+async def aset_job(db: sqlite3.Connection, playbook_hash: str, job_json: str) -> None:
+    """Async wrapper for set_job."""
+    await asyncio.to_thread(set_job, db, playbook_hash, job_json)
+
+
+def llm_get(db: sqlite3.Connection, prompt_hash: str) -> str | None:
+    """Return a cached LLM result for a prompt."""
+    row = db.execute(
+        "SELECT result FROM llm_cache WHERE prompt_hash = ?",
+        (prompt_hash,),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def llm_set(db: sqlite3.Connection, prompt_hash: str, result: str) -> None:
+    """Store an LLM result for a prompt."""
+    with db:
+        db.execute(
+            "INSERT OR REPLACE INTO llm_cache VALUES (?, ?)",
+            (prompt_hash, result),
+        )
+
+
+async def allm_get(db: sqlite3.Connection, prompt_hash: str) -> str | None:
+    """Async wrapper for llm_get."""
+    return await asyncio.to_thread(llm_get, db, prompt_hash)
+
+
+async def allm_set(db: sqlite3.Connection, prompt_hash: str, result: str) -> None:
+    """Async wrapper for llm_set."""
+    await asyncio.to_thread(llm_set, db, prompt_hash, result)
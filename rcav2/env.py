@@ -5,6 +5,8 @@
 This module defines the global environment shared by the other modules.
 """
 
+import asyncio
+from functools import cached_property, lru_cache
 import ssl
 import re
 import httpx
@@ -12,11 +14,12 @@ import pathlib
 import logging
 import time
 from httpx_gssapi import HTTPSPNEGOAuth, OPTIONAL  # type: ignore
+import rcav2.database
 import rcav2.models.errors
 from rcav2.tools.jira_client import Jira
 from rcav2.tools.slack import SlackClient
 from rcav2.models.zuul_info import ZuulInfo
-from rcav2.config import Settings
+from rcav2.config import Settings, get_settings
 
 
 class Env:
@@ -28,8 +31,7 @@ class Env:
         base_settings: Settings | None = None,
     ):
         if not base_settings:
-            # pydantic is magic and it auto load the missing named argument from the environment.
-            settings = Settings()  # type: ignore
+            settings = get_settings()
         else:
             settings = base_settings
         self.settings = settings
@@ -40,63 +42,115 @@ class Env:
         self.cookie = None
         self.cookie_path = settings.COOKIE_FILE
         self.cookie_age = 0.0
+        self.cookie_lock = asyncio.Lock()
         self.logjuicer_report: rcav2.models.errors.Report | None = None
         self.zuul_info: ZuulInfo | None = None
         self.zuul_info_age = 0.0
+        self.zuul_info_lock = asyncio.Lock()
         self.httpx = make_httpx_client(
             settings.SF_DOMAIN, settings.CA_BUNDLE_PATH, settings.COOKIE_FILE
         )
+        # Adopt the cookie restored in the httpx jar so a fresh process does
+        # not redo the SSO handshake while it is still valid.
+        if cookie := self.httpx.cookies.get("mod_auth_openidc_session"):
+            self.cookie = cookie
+            try:
+                self.cookie_age = pathlib.Path(self.cookie_path).stat().st_mtime
+            except (FileNotFoundError, TypeError):
+                pass
         self.auth = HTTPSPNEGOAuth(mutual_authentication=OPTIONAL)
         self.log = logging.getLogger("rcav2")
-        self.jira: Jira | None = None
-        self.slack: SlackClient | None = None
+        self.db = rcav2.database.create()
         self.extra_description: str | None = None
 
         self.ignore_lines: re.Pattern | None = None
         if settings.RCA_IGNORE_LINES:
-            self.ignore_lines = re.compile(settings.RCA_IGNORE_LINES)
+            self.ignore_lines = compile_ignore_lines(settings.RCA_IGNORE_LINES)
 
-        # Initialize JIRA client if credentials are available
+    @cached_property
+    def jira(self) -> Jira | None:
+        """The JIRA client, constructed on first use if credentials are available."""
+        settings = self.settings
         if settings.JIRA_URL and settings.JIRA_API_KEY and settings.JIRA_RCA_PROJECTS:
-            self.jira = Jira(
+            return Jira(
                 settings.JIRA_URL,
                 settings.JIRA_API_KEY,
                 settings.JIRA_RCA_PROJECTS,
             )
+        return None
 
-        # Initialize Slack client if credentials are available
+    @cached_property
+    def slack(self) -> SlackClient | None:
+        """The Slack client, constructed on first use if credentials are available."""
+        settings = self.settings
         if settings.SLACK_API_KEY and settings.SLACK_SEARCH_CHANNELS:
-            self.slack = SlackClient(
-                settings.SLACK_API_KEY, settings.SLACK_SEARCH_CHANNELS
-            )
+            return SlackClient(settings.SLACK_API_KEY, settings.SLACK_SEARCH_CHANNELS)
+        return None
 
-    def close(self):
+    def save_cookie(self):
+        """Persist the OIDC cookie so restarts skip the SSO handshake."""
         if self.cookie and self.cookie_path:
             with open(self.cookie_path, "w") as f:
                 f.write(self.cookie)
 
+    def close(self):
+        self.save_cookie()
+        self.db.close()
+
+
+@lru_cache(maxsize=8)
+def compile_ignore_lines(pattern: str) -> re.Pattern:
+    """Compile the ignore-lines pattern once per process.
+
+    The pattern is matched against every error line of every report, so keep
+    the compiled program shared instead of rebuilding it per Env.
+    """
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=4)
+def load_cookie(path: str, mtime: float) -> str | None:
+    """Read the cookie file, memoized by mtime so reloads only stat()."""
+    try:
+        return pathlib.Path(path).read_text()
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def make_ssl_context(ca_bundle_path: str) -> ssl.SSLContext | bool:
+    """Build the TLS context once: parsing the CA bundle PEM is expensive."""
+    if pathlib.Path(ca_bundle_path).exists():
+        return ssl.create_default_context(cafile=ca_bundle_path)
+    return True
+
 
 def make_httpx_client(
     sf_domain: str, ca_bundle_path: str, cookie_path: str | None
 ) -> httpx.AsyncClient:
     """Setup the httpx client using local CA."""
     # Load local CA
-    verify = True
-    if pathlib.Path(ca_bundle_path).exists():
-        verify = ssl.create_default_context(cafile=ca_bundle_path)  # type: ignore
+    verify = make_ssl_context(ca_bundle_path)
 
     # Restore cookies
     cookies = httpx.Cookies()
     if cookie_path:
         cookie_file = pathlib.Path(cookie_path)
         try:
-            if time.time() - cookie_file.stat().st_mtime > 24 * 3600:
-                cookie_file.unlink()
-            else:
-                cookie = cookie_file.read_text()
+            mtime = cookie_file.stat().st_mtime
+            if time.time() - mtime > 24 * 3600:
+                cookie_file.unlink(missing_ok=True)
+            elif cookie := load_cookie(str(cookie_file), mtime):
                 cookies.set("mod_auth_openidc_session", cookie, domain=sf_domain)
         except FileNotFoundError:
             pass
 
-    # Create the client
-    return httpx.AsyncClient(follow_redirects=True, verify=verify, cookies=cookies)
+    # Create the client. HTTP/2 lets the report PUT/GET legs multiplex one
+    # warmed connection, and the keepalive pool spares TCP+TLS handshakes.
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        verify=verify,
+        cookies=cookies,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
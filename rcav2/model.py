@@ -5,20 +5,26 @@
 This module defines the model configuration.
 """
 
+import logging
+from functools import lru_cache
+
 import dspy  # type: ignore[import-untyped]
 from dspy.utils.callback import BaseCallback  # type: ignore[import-untyped]
-import opik
-from opik.integrations.dspy.callback import OpikCallback
 
 from rcav2.config import Settings
 from rcav2.env import Env
 
+log = logging.getLogger("rcav2")
+
 
 class TraceManager:
     def __init__(self, env: Env, run_id: str, workflow: str, url: str):
         if env.settings.OPIK_DISABLED:
             self.enabled = False
         else:
+            # opik is a heavy import; only pay for it when tracing is on.
+            import opik
+
             self.enabled = True
             build_id = url.split("/")[-1] if "/" in url else "unknown"
             trace_name = f"RCA {workflow.title()} - Build {build_id}"
@@ -48,11 +54,24 @@ class TraceManager:
 
 
 def get_lm(settings: Settings, name: str, max_tokens: int) -> dspy.LM:
+    return _make_lm(name, settings.LLM_TEMPERATURE, max_tokens, settings.LLM_GEMINI_KEY)
+
+
+@lru_cache(maxsize=4)
+def _make_lm(name: str, temperature: float, max_tokens: int, api_key: str) -> dspy.LM:
+    # Memoized so re-running init_dspy does not rebuild the LM and its
+    # litellm provider state.
+    # The signature instructions and tool schemas are identical across every
+    # acall of a job, so ask the provider to serve that prefix from cache.
+    # Gemini 2.5 does implicit prefix caching server side; the injection
+    # points below add the explicit ephemeral markers needed by Anthropic
+    # style providers and are ignored by the others.
     return dspy.LM(
         f"gemini/{name}",
-        temperature=settings.LLM_TEMPERATURE,
+        temperature=temperature,
         max_tokens=max_tokens,
-        api_key=settings.LLM_GEMINI_KEY,
+        api_key=api_key,
+        cache_control_injection_points=[{"location": "message", "role": "system"}],
     )
 
 
@@ -71,6 +90,14 @@ class AgentLoggingCallback(BaseCallback):
         return any(k.startswith("Thought") for k in outputs.keys())
 
 
+@lru_cache(maxsize=1)
+def _opik_callback(project_name: str):
+    """Build the Opik callback once so reinits skip the config validation."""
+    from opik.integrations.dspy.callback import OpikCallback
+
+    return OpikCallback(project_name=project_name, log_graph=True)
+
+
 def init_dspy(settings: Settings) -> None:
     dspy.settings.configure(track_usage=True)
 
@@ -79,7 +106,7 @@ def init_dspy(settings: Settings) -> None:
 
     # Check if Opik is explicitly disabled
     if settings.OPIK_DISABLED:
-        print("Opik integration disabled by OPIK_DISABLED environment variable")
+        log.info("Opik integration disabled by OPIK_DISABLED environment variable")
         callbacks = []  # type: ignore
         if settings.DSPY_DEBUG:
             callbacks.append(AgentLoggingCallback())
@@ -91,22 +118,18 @@ def init_dspy(settings: Settings) -> None:
 
     # Configure Opik - use local deployment by default
     try:
-        print("Configuring Opik")
-
-        opik_callback = OpikCallback(
-            project_name=settings.OPIK_PROJECT_NAME,
-            log_graph=True,
-        )
+        log.info("Configuring Opik")
         dspy.configure(
             lm=get_lm(settings, "gemini-2.5-pro", 1024 * 1024),
-            callbacks=[opik_callback],
+            callbacks=[_opik_callback(settings.OPIK_PROJECT_NAME)],
         )
-        print(
-            f"DSPy configured with Opik tracing (project: {settings.OPIK_PROJECT_NAME})"
+        log.info(
+            "DSPy configured with Opik tracing (project: %s)",
+            settings.OPIK_PROJECT_NAME,
         )
     except Exception as e:
-        print(f"Failed to configure Opik: {e}")
-        print("Falling back to DSPy without Opik tracing")
+        log.warning("Failed to configure Opik: %s", e)
+        log.warning("Falling back to DSPy without Opik tracing")
         dspy.configure(lm=get_lm(settings, "gemini-2.5-pro", 1024 * 1024))
 
 
@@ -5,6 +5,8 @@
 This module contains helpers to pre-process a LogJuicer report.
 """
 
+import sys
+
 from pydantic import BaseModel
 
 
@@ -62,26 +64,32 @@ def read_log_url(target) -> str | None:
             return None
 
 
-def read_error(anomaly) -> Error:
-    return Error(
-        before=anomaly["before"],
-        line=anomaly["anomaly"]["line"],
-        pos=anomaly["anomaly"]["pos"],
-        after=anomaly["after"],
-    )
-
-
-def read_logfile(log_report) -> LogFile:
-    return LogFile(
-        source=read_source(log_report["source"]),
-        errors=list(map(read_error, log_report["anomalies"])),
-    )
-
-
 def json_to_report(report) -> Report:
-    return Report(
+    # This is the hot loop of report ingestion: one Error per anomaly,
+    # thousands per report. model_construct skips validation on the shapes
+    # logjuicer guarantees, and the fused comprehension keeps the
+    # constructors in locals instead of re-resolving them per item.
+    mk_error = Error.model_construct
+    mk_logfile = LogFile.model_construct
+    return Report.model_construct(
         target=read_target(report["target"]),
-        logfiles=list(map(read_logfile, report["log_reports"])),
+        logfiles=[
+            mk_logfile(
+                source=read_source(log_report["source"]),
+                errors=[
+                    mk_error(
+                        before=anomaly["before"],
+                        # The same error line commonly repeats across many
+                        # logfiles; interning keeps one copy of each.
+                        line=sys.intern(anomaly["anomaly"]["line"]),
+                        pos=anomaly["anomaly"]["pos"],
+                        after=anomaly["after"],
+                    )
+                    for anomaly in log_report["anomalies"]
+                ],
+            )
+            for log_report in report["log_reports"]
+        ],
         log_url=read_log_url(report["target"]),
     )
 
@@ -4,7 +4,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class JobInfo:
     name: str
     parent: str | None
@@ -12,26 +12,14 @@ class JobInfo:
     project: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectInfo:
     name: str
     branch: str
     provider: str
 
 
-def rstrip(s: str, n: str) -> str:
-    if s.endswith(n):
-        return s[: -len(n)]
-    return s
-
-
-def lstrip(s: str, n: str) -> str:
-    if s.startswith(n):
-        return s[len(n) :]
-    return s
-
-
-@dataclass
+@dataclass(slots=True)
 class ProviderInfo:
     name: str
     url: str
@@ -50,7 +38,7 @@ class ProviderInfo:
                 if self.url == "https://review.opendev.org":
                     return opendev()
                 else:
-                    url = rstrip(self.url, "/r")
+                    url = self.url.removesuffix("/r")
                     return f"{url}/cgit/{project}/tree/{path}?h={branch}"
             case "GitUrl":
                 if self.url == "https://opendev.org":
@@ -64,16 +52,16 @@ class ProviderInfo:
             case "GitlabUrl" | "GithubUrl" | "GerritUrl":
                 if self.url == "https://github.com":
                     return f"{self.url}/{project}"
-                url = rstrip(lstrip(rstrip(self.url, "/r"), "https://"), "/")
+                url = self.url.removesuffix("/r").removeprefix("https://").rstrip("/")
                 return f"git@{url}:{project}.git"
             case "GitUrl":
-                return f"{rstrip(self.url, '/')}/{project}"
+                return f"{self.url.rstrip('/')}/{project}"
             case _:
                 print(f"Unknown provider: {self}")
                 return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ZuulInfo:
     jobs: dict[str, JobInfo]
     projects: dict[str, ProjectInfo]
@@ -12,6 +12,10 @@ import asyncio
 
 workspace_root = Path("~/.cache/rca/gits")
 
+# Bumped whenever a repo is cloned or updated, so callers caching results
+# derived from the workspace contents can tell when to look again.
+workspace_generation = 0
+
 
 def url_to_path(urlstring: str) -> Path:
     """Convert a git url into a local path
@@ -40,14 +44,17 @@ async def run_check(args: list[str], cwd: Path | None = None):
 
 
 async def ensure_repo(url: str, update: bool = False) -> Path:
+    global workspace_generation
     path = url_to_path(url).expanduser()
     if (path / ".git").exists():
         if update:
             print(f"Updating {path}...")
             await run_check(["git", "fetch"], cwd=path)
             await run_check(["git", "reset", "--hard", "FETCH_HEAD"], cwd=path)
+            workspace_generation += 1
     else:
         print(f"Cloning {path}...")
         path.parent.mkdir(parents=True, exist_ok=True)
         await run_check(["git", "clone", url, str(path)])
+        workspace_generation += 1
     return path
@@ -34,14 +34,13 @@ class Jira:
 
         # Convert Issue objects to serializable dicts
         jira_base_url = self.client._options["server"]
-        result_list = []
-        for issue in results:
-            issue_dict = dict(
+        return [
+            dict(
                 key=issue.key,
                 url=f"{jira_base_url}/browse/{issue.key}",
                 summary=getattr(issue.fields, "summary", None),
                 status=str(getattr(issue.fields, "status", None)),
                 description=getattr(issue.fields, "description", None),
             )
-            result_list.append(issue_dict)
-        return result_list
+            for issue in results
+        ]
@@ -5,26 +5,37 @@
 This module contains helpers to query the logjuicer API.
 """
 
+import asyncio
 import os
 
+import orjson
+
+from rcav2.database import TTLCache
 from rcav2.models.errors import Report
 from rcav2.env import Env
 from rcav2.worker import Worker
 import rcav2.models.errors
 
+# Reports fetched recently, so back-to-back submissions of the same build
+# (e.g. through different workflows) skip the HTTP round-trip. Parsed
+# reports are multi-MB, so the cache is kept small.
+_report_cache = TTLCache[str, Report](ttl=120.0, maxsize=32)
 
-def make_local_report(url: str) -> Report:
-    import subprocess
-    import json
 
+async def make_local_report(url: str) -> Report:
     # This need: https://github.com/logjuicer/logjuicer/pull/178
-    return rcav2.models.errors.json_to_report(
-        json.loads(
-            subprocess.check_output(
-                ["logjuicer", "--report", "/dev/stdout", "errors", url]
-            )
-        )
+    proc = await asyncio.create_subprocess_exec(
+        "logjuicer",
+        "--report",
+        "/dev/stdout",
+        "errors",
+        url,
+        stdout=asyncio.subprocess.PIPE,
     )
+    (stdout, _) = await proc.communicate()
+    if proc.returncode:
+        raise RuntimeError(f"logjuicer failed: exit code {proc.returncode}")
+    return rcav2.models.errors.json_to_report(orjson.loads(stdout))
 
 
 async def wait_report(env: Env, wurl: str, report_id: int, worker: None | Worker):
@@ -39,7 +50,14 @@ async def wait_report(env: Env, wurl: str, report_id: int, worker: None | Worker
             wurl, env.httpx, auth=env.auth, keepalive_ping_timeout_seconds=None
         ) as ws:
             while True:
-                ev = await ws.receive_text()
+                # The server sends "..." keepalives while working, so a
+                # minute of silence means the connection is dead; break out
+                # and let the report download decide if the run completed.
+                try:
+                    ev = await asyncio.wait_for(ws.receive_text(), timeout=60)
+                except asyncio.TimeoutError:
+                    env.log.warning("%s: websocket went silent, moving on", wurl)
+                    break
                 match ev:
                     case "...":
                         ...
@@ -82,7 +100,10 @@ async def do_get_remote_report(env: Env, url: str, worker: None | Worker) -> Rep
 
     # Step3: download report
     curl = f"{env.sf_url}/logjuicer/api/report/{report_id}/json"
-    report = (await env.httpx.get(curl, auth=env.auth)).raise_for_status().json()
+    resp = (await env.httpx.get(curl, auth=env.auth)).raise_for_status()
+    # Reports can be multi-MB; orjson over the raw bytes skips the str
+    # decode and is much faster than the stdlib parser.
+    report = orjson.loads(resp.content)
     json_report = rcav2.models.errors.json_to_report(report)
     return json_report
 
@@ -97,11 +118,15 @@ async def get_remote_report(env: Env, url: str, worker: None | Worker) -> Report
 
     # It looks like there is an issue with httpx_ws which might raise an exception too early.
     # So we can safely retry in that case, because the step1 status will have progressed.
+    delay = 1.0
     while True:
         try:
             return await do_get_remote_report(env, url, worker)
         except httpx_ws.WebSocketNetworkError as e:
             env.log.error("WS error :/", e)
+            # Back off so a flapping server is not hammered with reconnects.
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
 
 
 async def get_local_report(env: Env, url: str) -> Report:
@@ -114,7 +139,7 @@ async def get_local_report(env: Env, url: str) -> Report:
         )
     env.log.info("Ingesting build log from %s", url)
     # TODO: handle creating remote report...
-    return make_local_report(url)
+    return await make_local_report(url)
 
 
 async def get_report(env: Env, url: str, worker: None | Worker) -> Report:
@@ -124,8 +149,11 @@ async def get_report(env: Env, url: str, worker: None | Worker) -> Report:
         report = env.logjuicer_report
     if os.environ.get("LOGJUICER_LOCAL"):
         report = await get_local_report(env, url)
+    elif cached := _report_cache.get(url):
+        report = cached
     else:
         report = await get_remote_report(env, url, worker)
+        _report_cache.set(url, report)
     if worker and report.log_url:
         await worker.emit(report.log_url, event="log_url")
     if worker:
@@ -135,10 +163,7 @@ async def get_report(env: Env, url: str, worker: None | Worker) -> Report:
         )
     if ignore_lines := env.ignore_lines:
         for logfile in report.logfiles:
-            logfile.errors = list(
-                filter(
-                    lambda err: not ignore_lines.search(err.line),
-                    logfile.errors,
-                )
-            )
+            logfile.errors = [
+                err for err in logfile.errors if not ignore_lines.search(err.line)
+            ]
     return report
@@ -1,6 +1,7 @@
 # Copyright © 2025 Red Hat
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import logging
 
 from slack_sdk import WebClient
@@ -12,31 +13,42 @@ class SlackClient:
         self.client = WebClient(token=token)
         self.channels = channels or []
 
-    def search_messages(self, query: str, count: int = 20) -> list[dict]:
-        all_messages: dict[str, dict] = {}
+    def search_channel(self, query: str, channel: str, count: int) -> list[dict]:
+        """Search a single channel, returning its matches."""
+        # remove '#' from channel name if present
+        channel_name = channel.strip().lstrip("#")
+        search_query = f"{query} in:#{channel_name}"
+
+        try:
+            result = self.client.search_messages(query=search_query, count=count)
+        except SlackApiError as e:
+            logging.error(f"Error searching slack in channel {channel}: {e}")
+            return []
+
+        if result["ok"]:
+            return result["messages"]["matches"]
+        return []
+
+    async def search_messages(self, query: str, count: int = 20) -> list[dict]:
+        # The WebClient is sync, so run the per-channel searches in threads
+        # and gather them: N channels cost ~one round-trip instead of N.
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self.search_channel, query, channel, count)
+                for channel in self.channels
+                if channel
+            )
+        )
 
-        for channel in self.channels:
-            if not channel:
-                continue
-
-            # remove '#' from channel name if present
-            channel_name = channel.strip().lstrip("#")
-            search_query = f"{query} in:#{channel_name}"
-
-            try:
-                result = self.client.search_messages(query=search_query, count=count)
-            except SlackApiError as e:
-                logging.error(f"Error searching slack in channel {channel}: {e}")
-                continue
-
-            if result["ok"]:
-                for match in result["messages"]["matches"]:
-                    permalink = match.get("permalink")
-                    if permalink and permalink not in all_messages:
-                        all_messages[permalink] = {
-                            "text": match.get("text"),
-                            "user": match.get("user"),
-                            "permalink": permalink,
-                            "channel": match.get("channel", {}).get("name"),
-                        }
+        all_messages: dict[str, dict] = {}
+        for matches in results:
+            for match in matches:
+                permalink = match.get("permalink")
+                if permalink and permalink not in all_messages:
+                    all_messages[permalink] = {
+                        "text": match.get("text"),
+                        "user": match.get("user"),
+                        "permalink": permalink,
+                        "channel": match.get("channel", {}).get("name"),
+                    }
         return list(all_messages.values())
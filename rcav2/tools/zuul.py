@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import logging
+import sys
 import time
 from pathlib import Path
 
@@ -10,48 +12,60 @@ import rcav2.tools.git
 from rcav2.env import Env
 from rcav2.models.zuul_info import ZuulInfo, JobInfo, ProjectInfo, ProviderInfo
 
+logger = logging.getLogger(__name__)
+
 
 async def fetch_weeder_export(env: Env) -> dict:
     """Fetch the raw weeder export"""
+    import orjson
+
     # Ensure we are authenticated, otherwise the redirection will fail to PUT
     await rcav2.auth.ensure_cookie(env)
     url = f"{env.sf_url}/weeder/export"
-    return (await env.httpx.get(url, auth=env.auth)).raise_for_status().json()
+    # The export can be tens of MB; orjson parses the body bytes directly.
+    resp = (await env.httpx.get(url, auth=env.auth)).raise_for_status()
+    return orjson.loads(resp.content)
 
 
 def read_weeder_export(export: dict) -> ZuulInfo:
     """Process the weeder export"""
     res = ZuulInfo({}, {}, {})
     for job, variants in export["jobs"].items():
-        mains = filter(lambda v: v[0]["branch"] in ["main", "master"], variants)
-        try:
-            [loc, info] = list(mains)[0]
-        except IndexError:
+        main = next((v for v in variants if v[0]["branch"] in ("main", "master")), None)
+        if not main:
             continue
+        [loc, info] = main
         project = loc["project"]
-        project_name = project["project"]
+        # Project and provider names repeat across most jobs: interning
+        # keeps one shared str per token and lets the dict lookups in
+        # job_url take the pointer-equality fast path.
+        project_name = sys.intern(project["project"])
         if project_name not in res.projects:
-            provider = project["provider"]
+            provider = sys.intern(project["provider"])
             res.projects[project_name] = ProjectInfo(
-                project_name, loc["branch"], provider
+                project_name, sys.intern(loc["branch"]), provider
             )
             url = loc["url"]
             res.providers.setdefault(
                 provider,
                 ProviderInfo(provider, url["contents"].rstrip("/"), url["tag"]),
             )
-        res.jobs[job] = JobInfo(job, info.get("parent"), loc["path"], project_name)
+        res.jobs[job] = JobInfo(
+            sys.intern(job), info.get("parent"), loc["path"], project_name
+        )
     return res
 
 
 def print_job_url(info: ZuulInfo, job_name: str):
-    job = info.jobs.get(job_name)
-    if not job:
-        print(f"Unknown job: {job_name}")
-        return
-    print(f"{job_name}: {info.job_url(job_name)}")
-    if parent := job.parent:
-        print_job_url(info, parent)
+    while True:
+        job = info.jobs.get(job_name)
+        if not job:
+            print(f"Unknown job: {job_name}")
+            return
+        print(f"{job_name}: {info.job_url(job_name)}")
+        if not job.parent:
+            return
+        job_name = job.parent
 
 
 async def fetch_job_repos(info: ZuulInfo, job_name: str):
@@ -66,10 +80,29 @@ async def fetch_job_repos(info: ZuulInfo, job_name: str):
         await fetch_job_repos(info, parent)
 
 
-def read_job(path: Path, job_name: str) -> dict | None:
+# Parsed job files keyed by path: the parent walk in get_job_playbooks
+# frequently revisits the same file, and YAML parsing is CPU-heavy.
+_job_file_cache: dict[str, tuple[float, list]] = {}
+
+
+def load_job_file(path: Path) -> list:
     import yaml
 
-    for obj in yaml.safe_load(open(path)):
+    mtime = path.stat().st_mtime
+    if cached := _job_file_cache.get(str(path)):
+        (cached_mtime, objs) = cached
+        if cached_mtime == mtime:
+            return objs
+    # The libyaml loader is several times faster when available.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        objs = yaml.load(f, Loader=loader)
+    _job_file_cache[str(path)] = (mtime, objs)
+    return objs
+
+
+def read_job(path: Path, job_name: str) -> dict | None:
+    for obj in load_job_file(path):
         if job := obj.get("job"):
             if job.get("name") == job_name:
                 return job
@@ -87,7 +120,7 @@ async def get_job_playbooks(info: ZuulInfo, job_name: str):
     while True:
         job = info.jobs.get(job_name)
         if not job:
-            print(f"Unknown job: {job_name}")
+            logger.warning("Unknown job: %s", job_name)
             break
         if url := info.project_git(job.project):
             path = await rcav2.tools.git.ensure_repo(url)
@@ -96,7 +129,7 @@ async def get_job_playbooks(info: ZuulInfo, job_name: str):
                     map(lambda play: path / play, as_list(job_def.get("run", [])))
                 )
             else:
-                print(f"{path}: Couldn't find job: {job_name}")
+                logger.warning("%s: Couldn't find job: %s", path, job_name)
         if not job.parent:
             break
         job_name = job.parent
@@ -104,24 +137,29 @@ async def get_job_playbooks(info: ZuulInfo, job_name: str):
 
 
 async def ensure_zuul_info(env: Env) -> ZuulInfo:
-    now = time.time()
-    if not env.zuul_info or now - env.zuul_info_age > 24 * 3600:
-        export = await fetch_weeder_export(env)
-        env.zuul_info = read_weeder_export(export)
-        env.zuul_info_age = now
-    return env.zuul_info
+    # The lock single-flights the refresh: concurrent jobs hitting a cold or
+    # expired cache wait for one weeder fetch instead of each firing their
+    # own, and the re-check inside picks up the fresh result.
+    async with env.zuul_info_lock:
+        now = time.time()
+        if not env.zuul_info or now - env.zuul_info_age > 24 * 3600:
+            export = await fetch_weeder_export(env)
+            env.zuul_info = read_weeder_export(export)
+            env.zuul_info_age = now
+        return env.zuul_info
 
 
 async def amain() -> None:
-    import json
+    import orjson
     import sys
 
     env = Env(True)
+    export_path = Path(".zuul-export.json")
     try:
-        export = json.load(open(".zuul-export.json"))
+        export = orjson.loads(export_path.read_bytes())
     except Exception:
         export = await fetch_weeder_export(env)
-        json.dump(export, open(".zuul-export.json", "w"))
+        export_path.write_bytes(orjson.dumps(export))
 
     info = read_weeder_export(export)
     match sys.argv[1:]:
@@ -6,72 +6,154 @@ This module defines a Pool object to manage job pub/sub
 """
 
 import asyncio
+import orjson
 from abc import abstractmethod
+from collections import defaultdict, deque
 
 type Body = str | bool | int | list | dict
 type Event = tuple[str, Body]
+# A pre-encoded SSE frame, tagged with its event kind.
+type Frame = tuple[str, bytes]
 
 
-class Watcher:
-    def __init__(self):
-        self.queue = asyncio.Queue()
+def encode_frame(event: Event) -> Frame:
+    """Encode an event into an SSE frame."""
+    return (event[0], b"data: " + orjson.dumps(event) + b"\n\n")
 
-    async def send(self, event: Event):
-        await self.queue.put(event)
 
-    async def recv(self) -> Event:
-        event = await self.queue.get()
+class Watcher:
+    def __init__(self, maxsize: int = 256):
+        # The queue is bounded so a stalled SSE client cannot make the
+        # server buffer a run's whole event stream.
+        self.queue: asyncio.Queue[Frame] = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def push(self, frame: Frame) -> None:
+        """Queue a frame, dropping the oldest when the client lags behind."""
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.recv_nowait()
+            self.dropped += 1
+            self.queue.put_nowait(frame)
+
+    async def recv(self) -> Frame:
+        frame = await self.queue.get()
+        self.queue.task_done()
+        return frame
+
+    def recv_nowait(self) -> Frame | None:
+        """Return the next frame if one is already queued."""
+        try:
+            frame = self.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
         self.queue.task_done()
-        return event
+        return frame
 
 
 class Worker:
     """A worker process that can be watched"""
 
+    def __init__(self):
+        # The history is bucketed per event kind so that completion-time
+        # persistence can pick the wanted kinds without scanning every
+        # progress event of a long run. Each bucket is bounded so a very
+        # chatty run cannot grow the worker memory without limit; only the
+        # progress bucket ever comes close to the cap in practice.
+        self.history: dict[str, deque[tuple[int, Body]]] = defaultdict(
+            lambda: deque(maxlen=4096)
+        )
+        self._seq = 0
+
+    def record(self, body: Body, event: str) -> None:
+        """Keep the event for later persistence."""
+        self.history[event].append((self._seq, body))
+        self._seq += 1
+
+    def events(self, skip: frozenset[str] = frozenset(["progress"])) -> list[Event]:
+        """Return the recorded events in emission order, minus the given kinds.
+
+        >>> worker = CLIWorker()
+        >>> worker.record("checking...", "progress")
+        >>> worker.record({"summary": "oops"}, "report")
+        >>> worker.events()
+        [('report', {'summary': 'oops'})]
+        """
+        kept = [
+            (seq, (kind, body))
+            for kind, bodies in self.history.items()
+            if kind not in skip
+            for seq, body in bodies
+        ]
+        kept.sort()
+        return [event for _, event in kept]
+
     @abstractmethod
     async def emit(self, body: Body, event: str) -> None: ...
 
 
 class APIWorker(Worker):
     def __init__(self, watcher: Watcher):
-        self.watcher = watcher
+        super().__init__()
+        self.watchers = [watcher]
+
+    def attach(self, watcher: Watcher) -> bytes:
+        """Attach a late watcher, returning a replay of the events so far.
+
+        The replay is handed back as one pre-encoded chunk for the
+        response body: pushing it through the bounded queue would drop
+        the oldest frames of a long run before the client read a byte.
+        """
+        self.watchers.append(watcher)
+        return b"".join(
+            encode_frame(event)[1] for event in self.events(skip=frozenset())
+        )
 
     async def emit(self, body: Body, event: str) -> None:
-        await self.watcher.send((event, body))
+        self.record(body, event)
+        # Encode the frame once; it is shared by every attached watcher.
+        frame = encode_frame((event, body))
+        for watcher in self.watchers:
+            watcher.push(frame)
 
 
 class CLIWorker(Worker):
     async def emit(self, body: Body, event: str) -> None:
         if event == "report" and isinstance(body, dict):
+            # Collect the whole report and write it in one go, instead of
+            # one line-buffered print per evidence line.
+            out: list[str] = []
             if "possible_root_causes" in body:
                 # New format with possible_root_causes
-                print("Report\n~~~~~~\n")
+                out.append("Report\n~~~~~~\n")
                 if body.get("summary"):
-                    print(f"Summary:\n{body['summary']}\n")
+                    out.append(f"Summary:\n{body['summary']}\n")
                 for i, root_cause in enumerate(body["possible_root_causes"], 1):
-                    print(f"Possible Root Cause {i}:")
-                    print(f"{root_cause['cause']}\n")
-                    print("Evidences:")
+                    out.append(f"Possible Root Cause {i}:")
+                    out.append(f"{root_cause['cause']}\n")
+                    out.append("Evidences:")
                     for evidence in root_cause["evidences"]:
-                        print(f"- {evidence['error']}")
-                        print(f"  source: {evidence['source']}")
-                    print()
+                        out.append(f"- {evidence['error']}")
+                        out.append(f"  source: {evidence['source']}")
+                    out.append("")
 
                 if body.get("jira_tickets"):
-                    print("Related JIRA Tickets:\n")
+                    out.append("Related JIRA Tickets:\n")
                     for ticket in body["jira_tickets"]:
-                        print(f"- {ticket['key']}: {ticket['summary']}")
-                        print(f"  {ticket['url']}")
+                        out.append(f"- {ticket['key']}: {ticket['summary']}")
+                        out.append(f"  {ticket['url']}")
             else:
                 # Legacy format with description/evidences
-                print(f"Report\n~~~~~~\n\n{body['description']}\n\nEvidences:\n")
+                out.append(f"Report\n~~~~~~\n\n{body['description']}\n\nEvidences:\n")
                 for evidence in body["evidences"]:
-                    print(f"- {evidence['error']}\n  source: {evidence['source']}")
+                    out.append(f"- {evidence['error']}\n  source: {evidence['source']}")
 
                 if body.get("jira_tickets"):
-                    print("\nRelated JIRA Tickets:\n")
+                    out.append("\nRelated JIRA Tickets:\n")
                     for ticket in body["jira_tickets"]:
-                        print(f"- {ticket['key']}: {ticket['summary']}")
-                        print(f"  {ticket['url']}")
+                        out.append(f"- {ticket['key']}: {ticket['summary']}")
+                        out.append(f"  {ticket['url']}")
+            print("\n".join(out))
         else:
             print(f"{event} - {body}")
@@ -5,14 +5,19 @@
 This module defines the RCA workflows.
 """
 
+import asyncio
+import hashlib
 import uuid
 
+import httpx
+
 from rcav2.env import Env
 from rcav2.worker import Worker
 from rcav2.agent.ansible import Job
 from rcav2.models.report import Report
 from rcav2.model import TraceManager
 
+import rcav2.database
 import rcav2.tools.logjuicer
 import rcav2.tools.zuul
 import rcav2.agent.ansible
@@ -22,33 +27,46 @@ import rcav2.agent.predict
 import rcav2.agent.react
 
 
-def load_job_description_file(dfile) -> str | None:
+# JOB_DESCRIPTION_FILE cannot change while the process runs, so a
+# successful load (possibly a slow HTTP GET) is only ever paid once.
+# Failures are not cached: a transient fetch error should not disable
+# the extra description for the life of the process.
+_description_cache: dict[str, str] = {}
+
+
+async def load_job_description_file(env: Env, dfile) -> str | None:
     """Load additional job description from file or URL specified by JOB_DESCRIPTION_FILE environment variable."""
     if not dfile:
         return None
+    if dfile in _description_cache:
+        return _description_cache[dfile]
 
     # Check if it's a URL (starts with http:// or https://)
-    if dfile and dfile.startswith(("http://", "https://")):
+    if dfile.startswith(("http://", "https://")):
         try:
-            import httpx
-
-            response = httpx.get(dfile, timeout=30.0)
+            # Fail fast on a dead endpoint instead of stalling the first
+            # workflow for the whole monolithic 30s budget.
+            timeout = httpx.Timeout(connect=3.0, read=10.0, write=5.0, pool=2.0)
+            response = await env.httpx.get(dfile, timeout=timeout)
             response.raise_for_status()
-            return response.text.strip()
+            desc = response.text.strip()
         except Exception as e:
             print(f"Error fetching job description from URL {dfile}: {e}")
-            return None
+            desc = None
     else:
         # Treat as local file path
         try:
             with open(dfile, "r", encoding="utf-8") as f:
-                return f.read().strip()
+                desc = f.read().strip()
         except FileNotFoundError:
             print(f"Job description file not found: {dfile}")
-            return None
+            desc = None
         except Exception as e:
             print(f"Error reading job description file {dfile}: {e}")
-            return None
+            desc = None
+    if desc is not None:
+        _description_cache[dfile] = desc
+    return desc
 
 
 async def job_from_model(env: Env, name: str, worker: Worker) -> Job | None:
@@ -59,9 +77,24 @@ async def job_from_model(env: Env, name: str, worker: Worker) -> Job | None:
         await worker.emit(f"Couldn't find job {name}", event="error")
         return None
     else:
+        # Zuul jobs commonly share base playbooks, so the oracle result is
+        # cached by the hash of the playbook set rather than the job name.
+        key = hashlib.blake2b(
+            "\n".join(sorted(map(str, plays))).encode(), digest_size=16
+        ).hexdigest()
+        if cached := await rcav2.database.aget_job(env.db, key):
+            await worker.emit("Analyzing job... (cached)", event="progress")
+            # call_agent emits the playbook list on the cold path; keep the
+            # cached run's event stream identical for the UI.
+            await worker.emit(
+                rcav2.agent.ansible.relative_playbooks(plays), event="playbooks"
+            )
+            return Job.model_validate_json(cached)
         await worker.emit("Analyzing job...", event="progress")
         agent = rcav2.agent.ansible.make_agent(worker)
-        return await rcav2.agent.ansible.call_agent(agent, plays, worker)
+        job = await rcav2.agent.ansible.call_agent(agent, plays, worker)
+        await rcav2.database.aset_job(env.db, key, job.model_dump_json())
+        return job
 
 
 async def describe_job(env: Env, job_name: str, worker: Worker) -> Job | None:
@@ -69,7 +102,9 @@ async def describe_job(env: Env, job_name: str, worker: Worker) -> Job | None:
     # Load additional job description from file if specified
     if desc := env.extra_description:
         additional_description = desc
-    elif desc := load_job_description_file(env.settings.JOB_DESCRIPTION_FILE):
+    elif desc := await load_job_description_file(
+        env, env.settings.JOB_DESCRIPTION_FILE
+    ):
         additional_description = desc
         await worker.emit(
             f"Loaded additional job description from {env.settings.JOB_DESCRIPTION_FILE}",
@@ -88,8 +123,8 @@ async def describe_job(env: Env, job_name: str, worker: Worker) -> Job | None:
     return job
 
 
-async def rca_predict(env: Env, url: str, worker: Worker) -> None:
-    """A two step workflow with job description"""
+async def fetch_context(env: Env, url: str, worker: Worker):
+    """The common workflow prologue: build errors and job description."""
     await worker.emit("Fetching build errors...", event="progress")
     errors_report = await rcav2.tools.logjuicer.get_report(env, url, worker)
 
@@ -97,10 +132,16 @@ async def rca_predict(env: Env, url: str, worker: Worker) -> None:
     job = await describe_job(env, errors_report.target, worker)
     if job:
         await worker.emit(job.model_dump(), event="job")
+    return (errors_report, job)
+
+
+async def rca_predict(env: Env, url: str, worker: Worker) -> None:
+    """A two step workflow with job description"""
+    (errors_report, job) = await fetch_context(env, url, worker)
 
     rca_agent = rcav2.agent.predict.make_agent()
     (possible_root_causes, summary) = await rcav2.agent.predict.call_agent(
-        rca_agent, job, errors_report, worker
+        rca_agent, job, errors_report, worker, env
     )
 
     report = Report(
@@ -111,19 +152,13 @@ async def rca_predict(env: Env, url: str, worker: Worker) -> None:
 
 async def rca_multi(env: Env, url: str, worker: Worker) -> None:
     """A three step workflow with job description and jira agent"""
-    await worker.emit("Fetching build errors...", event="progress")
-    errors_report = await rcav2.tools.logjuicer.get_report(env, url, worker)
-
-    # Step1: Getting build description
-    await worker.emit(f"Describing job {errors_report.target}...", event="progress")
-    job = await describe_job(env, errors_report.target, worker)
-    if job:
-        await worker.emit(job.model_dump(), event="job")
+    # Step1: Getting build errors and description
+    (errors_report, job) = await fetch_context(env, url, worker)
 
     # Step2: Analyzing build errors
     rca_agent = rcav2.agent.predict.make_agent()
     (root_causes, summary) = await rcav2.agent.predict.call_agent(
-        rca_agent, job, errors_report, worker
+        rca_agent, job, errors_report, worker, env
     )
 
     # Step3: Gathering additional context
@@ -142,13 +177,7 @@ async def rca_multi(env: Env, url: str, worker: Worker) -> None:
 
 async def rca_react(env: Env, url: str, worker: Worker) -> None:
     """A two step workflow using a ReAct module"""
-    await worker.emit("Fetching build errors...", event="progress")
-    errors_report = await rcav2.tools.logjuicer.get_report(env, url, worker)
-
-    await worker.emit(f"Describing job {errors_report.target}...", event="progress")
-    job = await describe_job(env, errors_report.target, worker)
-    if job:
-        await worker.emit(job.model_dump(), event="job")
+    (errors_report, job) = await fetch_context(env, url, worker)
 
     rca_agent = rcav2.agent.react.make_agent(errors_report, worker, env)
     report = await rcav2.agent.react.call_agent(rca_agent, job, errors_report, worker)
@@ -168,5 +197,19 @@ async def run_workflow(env: Env, workflow: str, url: str, worker: Worker) -> Non
             raise RuntimeError(f"{workflow}: unknown workflow")
     run_id = str(uuid.uuid4())
     await worker.emit(run_id, event="run_id")
-    with TraceManager(env, run_id, workflow, url):
-        await func(env, url, worker)
+    # Warm the zuul info while logjuicer works: describe_job needs it, but
+    # only learns the job name once the errors report arrives.
+    prefetch = asyncio.create_task(rcav2.tools.zuul.ensure_zuul_info(env))
+
+    def consume_prefetch(task: asyncio.Task) -> None:
+        # Retrieve a failure so asyncio doesn't log it as unretrieved at
+        # GC; describe_job surfaces the real error when it retries.
+        if not task.cancelled() and (exc := task.exception()):
+            env.log.debug("zuul info prefetch failed: %s", exc)
+
+    prefetch.add_done_callback(consume_prefetch)
+    try:
+        with TraceManager(env, run_id, workflow, url):
+            await func(env, url, worker)
+    finally:
+        prefetch.cancel()